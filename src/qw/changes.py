@@ -1,15 +1,31 @@
 """Compares changes between remote and local data, allowing the user to make decisions."""
 from abc import ABC, abstractmethod
-from collections import OrderedDict, defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
+from loguru import logger
 from rich.console import Console
+from rich.markup import escape
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
-
-from qw.design_stages.main import DesignStages, get_local_stages, get_remote_stages
+from rich.text import Text
+
+from qw.base import QwError
+from qw.design_stages.main import (
+    DesignStages,
+    build_design_stages,
+    get_local_stages,
+    get_remote_stages,
+)
 from qw.local_store.main import LocalStore
 from qw.remote_repo.service import GitService
 
+# Shared by all output and prompts, rather than setting up a console each time
+_CONSOLE = Console()
+
+# Every remote stage cache written by ChangeHandler has these keys
+_REMOTE_CACHE_KEYS = frozenset(["fingerprint", "head", "stages"])
+
 
 class LocalChangeDeterminer(ABC):
     """
@@ -45,6 +61,7 @@ class LocalChangeInteractive(LocalChangeDeterminer, str):
         return Confirm.ask(
             f"{name} no longer exists in remote,"
             " would you like to remove it from the local store?",
+            console=_CONSOLE,
         )
 
     def version_increment(self):
@@ -58,7 +75,7 @@ class LocalChangeInteractive(LocalChangeDeterminer, str):
                 "",
             ],
         )
-        response = Prompt.ask(prompt, choices=["n", "u", "i"])
+        response = Prompt.ask(prompt, choices=["n", "u", "i"], console=_CONSOLE)
         if response == "n":
             return None
         if response == "i":
@@ -66,6 +83,60 @@ class LocalChangeInteractive(LocalChangeDeterminer, str):
         return 0
 
 
+class LocalChangeBulk(LocalChangeDeterminer):
+    """Gives the same answer for every changed object, but asks about each removal."""
+
+    def __init__(self, update_decision: int | None):
+        """
+        Initialize.
+
+        :param update_decision: The answer for every changed object, as
+        returned by `version_increment`.
+        """
+        self._update_decision = update_decision
+        self._interactive = LocalChangeInteractive()
+
+    def should_remove_deleted_object(self, name):
+        """Ask the user if they want to delete the object."""
+        return self._interactive.should_remove_deleted_object(name)
+
+    def version_increment(self):
+        """Give the chosen answer."""
+        return self._update_decision
+
+    @classmethod
+    def ask_policy(cls, changed_count: int) -> LocalChangeDeterminer:
+        """
+        Ask the user once what to do with all of the changed objects.
+
+        :param changed_count: The number of changed objects.
+        :return: A LocalChangeBulk for the chosen answer, or a
+        LocalChangeInteractive if the user wants to be asked about each.
+        """
+        prompt = "\n".join(
+            [
+                f"{changed_count} items have changed. Would you like to:",
+                "n (Don't save any of the updates)",
+                "u (Update all, but trivial changes so don't increment the versions)",
+                "i (Update all and increment the versions)",
+                "a (Ask about each item)",
+                "",
+            ],
+        )
+        response = Prompt.ask(
+            prompt,
+            choices=["n", "u", "i", "a"],
+            console=_CONSOLE,
+        )
+        if response == "a":
+            return LocalChangeInteractive()
+        if response == "n":
+            return cls(None)
+        if response == "i":
+            return cls(1)
+        return cls(0)
+
+
 class LocalChangeNone(LocalChangeDeterminer, str):
     """Always says not to change anything."""
 
@@ -78,132 +149,223 @@ class LocalChangeNone(LocalChangeDeterminer, str):
         return
 
 
-class ChangeHandler:
-    """Allow user interaction to manage changes between local and remote design stage data."""
+class DiffElement:
+    """A potential update to the local store."""
+
+    __slots__ = (
+        "_service",
+        "_local_item",
+        "_remote_item",
+        "_diff_computed",
+        "_diff_value",
+        "_shown",
+    )
+
+    def __init__(
+        self,
+        service: GitService,
+        local_item: DesignStages | None,
+        remote_item: DesignStages | None,
+    ):
+        """
+        Initialize.
+
+        :param service: The Git service object.
+        :param local_item: The "self" (local) item of the diff.
+        :param remote_item: The "other" (remote) item of the diff.
+        """
+        self._service = service
+        self._local_item = local_item
+        self._remote_item = remote_item
+        self._diff_computed = False
+        self._diff_value: tuple[tuple[str, str, str], ...] | None = None
+        self._shown = False
+
+    @property
+    def local_item(self) -> DesignStages | None:
+        """Get the item in the local store, or None if it is only remote."""
+        return self._local_item
+
+    @property
+    def _diff(self) -> tuple[tuple[str, str, str], ...] | None:
+        """
+        Get the differences between the local and remote items.
 
-    class DiffElement:
-        """A potential update to the local store."""
+        Only computed when first needed.
 
-        def __init__(
-            self,
-            service: GitService,
-            local_item: DesignStages | None,
-            remote_item: DesignStages | None,
-        ):
-            """
-            Initialize.
-
-            :param service: The Git service object.
-            :param local_item: The "self" (local) item of the diff.
-            :param remote_item: The "other" (remote) item of the diff.
-            """
-            self._service = service
-            self._diff = None
-            if local_item is not None and remote_item is not None:
-                self._diff = local_item.diff(remote_item)
-            self._local_item = local_item
-            self._remote_item = remote_item
-
-        def show(self):
-            """Show this difference on the screen."""
-            if not bool(self._diff):
-                if self._local_item is None:
-                    Console().print(
-                        "[green]New item ({}) #{}: {}[/]".format(
-                            self._remote_item.stage.value,
-                            self._remote_item.internal_id,
-                            self._remote_item.title.replace("[", "\\["),
-                        ),
-                    )
-                    return self._remote_item
-                if self._remote_item is not None:
-                    # Both exist, but no difference
-                    return self._local_item
-                if not self._local_item.is_marked_deleted():
-                    # Only a local item, and it has not yet been marked as deleted
-                    Console().print(
-                        "[red]Removed item ({}) #{}: {}[/]".format(
-                            self._local_item.stage.value,
-                            self._local_item.internal_id,
-                            self._local_item.title.replace("[", "\\["),
-                        ),
-                    )
-                return None
-            table = Table(
-                title=f"Changes detected for {self._local_item}:",
-                show_lines=True,
-                expand=True,
-            )
-            table.add_column("Field", justify="right", style="cyan")
-            table.add_column("Local", justify="left", style="magenta")
-            table.add_column(
-                f"{self._service.username}/{self._service.reponame}",
-                justify="left",
-                style="green",
-            )
-            for field, differences in self._diff.items():
-                table.add_row(field, differences["self"], differences["other"])
+        :return: None if either item does not exist, otherwise a
+        (field, local value, remote value) row for each field that
+        differs (empty if the items are the same).
+        """
+        if not self._diff_computed:
+            self._diff_value = self._compute_diff()
+            self._diff_computed = True
+        return self._diff_value
 
-            Console().print(table)
+    def _compute_diff(self) -> tuple[tuple[str, str, str], ...] | None:
+        if self._local_item is None or self._remote_item is None:
             return None
+        return self._local_item.diff_rows(self._remote_item)
 
-        def _version_change_where_remote_deleted(
-            self,
-            determiner: LocalChangeDeterminer,
-        ) -> DesignStages:
-            """Prompt the user for a deleted object, if appropriate."""
+    def show(self):
+        """Show this difference on the screen."""
+        if not bool(self._diff):
             if self._local_item is None:
-                return None
-            if self._local_item.is_marked_deleted():
-                # User has already requested to keep it
-                return self._local_item
-            # User has not requested to keep it yet
-            if determiner.should_remove_deleted_object(self._local_item):
-                # Remove the local item
-                return None
-            # Keep the local item
-            self._local_item.mark_as_deleted()
-            return self._local_item
-
-        def prompt_for_version_change(
-            self,
-            determiner: LocalChangeDeterminer,
-        ) -> DesignStages:
-            """
-            Prompt the user for what they want to do with this diff.
-
-            :return: The item so be stored in the local store; either
-            the local item (for no change) or the remote item (possibly
-            with the version number incremented).
-            """
-            if self._local_item is None:
-                # New remote item, no prompt required
+                _CONSOLE.print(
+                    "[green]New item ({}) #{}: {}[/]".format(
+                        self._remote_item.stage.value,
+                        self._remote_item.internal_id,
+                        escape(self._remote_item.title),
+                    ),
+                )
                 return self._remote_item
-            if self._remote_item is None:
-                return self._version_change_where_remote_deleted(determiner)
-            if not bool(self._diff):
+            if self._remote_item is not None:
                 # Both exist, but no difference
                 return self._local_item
-            # Both exist and there is a difference
-            update_decision = determiner.version_increment()
-            if update_decision is None:
-                return self._local_item
-            self._remote_item.version = self._local_item.version + update_decision
+            if not self._local_item.is_marked_deleted():
+                # Only a local item, and it has not yet been marked as deleted
+                _CONSOLE.print(
+                    "[red]Removed item ({}) #{}: {}[/]".format(
+                        self._local_item.stage.value,
+                        self._local_item.internal_id,
+                        escape(self._local_item.title),
+                    ),
+                )
+            return None
+        if not _CONSOLE.is_terminal:
+            # Not worth laying out a table that nobody is looking at
+            logger.info("Changes detected for {}:", self._local_item)
+            for field, local_value, remote_value in self._diff:
+                logger.info("{}: {!r} -> {!r}", field, local_value, remote_value)
+            return None
+        table = Table(
+            title=f"Changes detected for {escape(repr(self._local_item))}:",
+            show_lines=True,
+            expand=True,
+        )
+        table.add_column("Field", justify="right", style="cyan")
+        table.add_column("Local", justify="left", style="magenta")
+        table.add_column(
+            self._service.full_name,
+            justify="left",
+            style="green",
+        )
+        for row in self._diff:
+            # Values are shown literally, not parsed as console markup
+            table.add_row(*(Text(value) for value in row))
+
+        _CONSOLE.print(table)
+        return None
+
+    def show_once(self):
+        """Show this difference on the screen, unless it has already been shown."""
+        if not self._shown:
+            self._shown = True
+            self.show()
+
+    def is_changed(self) -> bool:
+        """Both the local and remote items exist, and they differ."""
+        return bool(self._diff)
+
+    def is_unchanged(self) -> bool:
+        """Both the local and remote items exist, and they are the same."""
+        return self._diff == ()
+
+    def _version_change_where_remote_deleted(
+        self,
+        determiner: LocalChangeDeterminer,
+    ) -> DesignStages:
+        """Prompt the user for a deleted object, if appropriate."""
+        local_item = self._local_item
+        if local_item is None:
+            return None
+        if local_item.is_marked_deleted():
+            # User has already requested to keep it
+            return local_item
+        # User has not requested to keep it yet
+        if determiner.should_remove_deleted_object(local_item):
+            # Remove the local item
+            return None
+        # Keep the local item
+        local_item.mark_as_deleted()
+        return local_item
+
+    def prompt_for_version_change(
+        self,
+        determiner: LocalChangeDeterminer,
+    ) -> DesignStages:
+        """
+        Prompt the user for what they want to do with this diff.
+
+        :return: The item so be stored in the local store; either
+        the local item (for no change) or the remote item (possibly
+        with the version number incremented).
+        """
+        if self._local_item is None:
+            # New remote item, no prompt required
             return self._remote_item
+        if self._remote_item is None:
+            return self._version_change_where_remote_deleted(determiner)
+        if not bool(self._diff):
+            # Both exist, but no difference
+            return self._local_item
+        # Both exist and there is a difference
+        update_decision = determiner.version_increment()
+        if update_decision is None:
+            return self._local_item
+        self._remote_item.version = self._local_item.version + update_decision
+        return self._remote_item
+
+
+class ChangeHandler:
+    """Allow user interaction to manage changes between local and remote design stage data."""
 
-    def __init__(self, service: GitService, store: LocalStore):
-        """Create ChangeHandler instance."""
+    def __init__(
+        self,
+        service: GitService,
+        store: LocalStore,
+        *,
+        use_cache: bool = True,
+    ):
+        """
+        Create ChangeHandler instance.
+
+        :param use_cache: Whether remote design stages can be read from
+        the cache. They are written to it either way.
+        """
         self._service = service
         self._store = store
+        self._use_cache = use_cache
 
     def combine_local_and_remote_items(self) -> list[DesignStages]:
         """Compare local and remote design stages and prompt on any differences."""
         diff_elements = self.diff_remote_and_local_items()
-        return self.get_local_items_from_diffs(
-            diff_elements,
-            LocalChangeInteractive(),
+        return list(
+            self.get_local_items_from_diffs(
+                diff_elements,
+                self.get_interactive_determiner(diff_elements),
+            ),
         )
 
+    @classmethod
+    def get_interactive_determiner(
+        cls,
+        diff_elements: list[DiffElement],
+    ) -> LocalChangeDeterminer:
+        """
+        Find out how the user wants to decide on changes.
+
+        If more than one item has changed, every change is shown and
+        then the user can choose one answer for all of them rather than
+        being asked about each.
+        """
+        changed = [element for element in diff_elements if element.is_changed()]
+        if len(changed) <= 1:
+            return LocalChangeInteractive()
+        for element in changed:
+            element.show_once()
+        return LocalChangeBulk.ask_policy(len(changed))
+
     def diff_remote_and_local_items(self) -> list[DiffElement]:
         """
         Find all differences between local and remote design stages.
@@ -214,12 +376,12 @@ class ChangeHandler:
         paired = self._pair_remote_and_local()
 
         diff_elements = []
-        for _internal_id, pair in paired.items():
+        for local_item, remote_item in paired:
             diff_elements.append(
-                ChangeHandler.DiffElement(
+                DiffElement(
                     self._service,
-                    pair.get("local"),
-                    pair.get("remote"),
+                    local_item,
+                    remote_item,
                 ),
             )
 
@@ -230,34 +392,102 @@ class ChangeHandler:
         cls,
         diff_elements: list[DiffElement],
         determiner: LocalChangeDeterminer,
-    ) -> list[DesignStages]:
+    ) -> Iterator[DesignStages]:
         """
         Transform DiffElements into local items to be stored.
 
+        Each difference is shown (and the user asked about it if
+        necessary) as the iterator reaches it, unless it has already
+        been shown.
+
         :param diff_elements: An iterable of DiffElements, each
         representing a difference between the remote and local
         items.
         :param determiner: Determines what to do with each change.
-        :return: A list of local items to be set in the store.
+        :return: An iterator of local items to be set in the store.
         """
-        output_items = []
         for diff_element in diff_elements:
-            diff_element.show()
+            if diff_element.is_unchanged():
+                # Nothing to show or ask
+                yield diff_element.local_item
+                continue
+            diff_element.show_once()
             output_item = diff_element.prompt_for_version_change(
                 determiner,
             )
             if output_item is not None:
-                output_items.append(output_item)
+                yield output_item
 
-        return output_items
-
-    def _pair_remote_and_local(self) -> dict[int, dict[str, DesignStages]]:
-        paired_data: dict[int, dict[str, DesignStages]] = defaultdict(dict)
-
-        for stage in get_remote_stages(self._service):
-            paired_data[stage.internal_id]["remote"] = stage
+    def _pair_remote_and_local(
+        self,
+    ) -> list[tuple[DesignStages | None, DesignStages | None]]:
+        """
+        Pair up local and remote design stages with the same internal ID.
 
-        for stage in get_local_stages(self._store):
-            paired_data[stage.internal_id]["local"] = stage
+        :return: (local, remote) pairs sorted by internal ID, with None
+        in place of a stage that only exists on the other side.
+        """
+        # Read the local store while we wait for the remote service
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            remote_future = executor.submit(self._get_remote_stages)
+            local_future = executor.submit(get_local_stages, self._store)
+            remote_stages = remote_future.result()
+            local_stages = local_future.result()
+
+        remote_by_id = {stage.internal_id: stage for stage in remote_stages}
+        local_by_id = {stage.internal_id: stage for stage in local_stages}
+        return [
+            (local_by_id.get(internal_id), remote_by_id.get(internal_id))
+            for internal_id in sorted(local_by_id.keys() | remote_by_id.keys())
+        ]
+
+    def _get_remote_stages(self) -> DesignStages:
+        """
+        Get the remote design stages, from the cache if they have not changed.
 
-        return OrderedDict(sorted(paired_data.items()))
+        The cache is valid while both the service's fingerprint of all
+        its issues and pull requests and the local repository's HEAD
+        commit are unchanged.
+        """
+        fingerprint = self._service.get_remote_fingerprint()
+        if fingerprint is None:
+            return get_remote_stages(self._service)
+        head = self._store.head_commit()
+        cache = self._read_remote_cache() if self._use_cache else None
+        if (
+            cache is not None
+            and fingerprint == cache["fingerprint"]
+            and head == cache["head"]
+        ):
+            try:
+                stages = build_design_stages(cache["stages"])
+            except (QwError, KeyError, TypeError, ValueError):
+                logger.warning("Remote stage cache is invalid, fetching again")
+            else:
+                logger.debug("Remote design stages unchanged, using cache")
+                return stages
+        # Raises if any of the remote data cannot be fetched, so only a
+        # complete set of stages is ever cached
+        stages = get_remote_stages(self._service)
+        self._store.write_remote_cache(
+            {
+                "fingerprint": fingerprint,
+                "head": head,
+                "stages": [stage.to_dict() for stage in stages],
+            },
+        )
+        return stages
+
+    def _read_remote_cache(self) -> dict | None:
+        """Read the remote stage cache, or None if there is no usable one."""
+        try:
+            cache = self._store.read_remote_cache()
+        except ValueError:
+            logger.warning("Remote stage cache is not valid JSON, fetching again")
+            return None
+        if cache is None or (
+            isinstance(cache, dict) and _REMOTE_CACHE_KEYS <= cache.keys()
+        ):
+            return cache
+        logger.warning("Remote stage cache is invalid, fetching again")
+        return None
@@ -4,41 +4,20 @@ The qw (Quality Workflow) tool.
 Helps enforce regulatory compliance for projects managed on GitHub.
 """
 
+import csv
+import functools
 import sys
+from collections import defaultdict, deque
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Any, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Optional
 
-import git
 import typer
 from loguru import logger
-from rich.console import Console
-from rich.prompt import Prompt
 
 from qw._version import __version__
 from qw.base import QwError
-from qw.changes import (
-    ChangeHandler,
-    LocalChangeInteractive,
-    LocalChangeNone,
-)
-from qw.design_stages._base import DesignBase
-from qw.design_stages.checks import (
-    CheckImpact,
-    CheckResult,
-    get_check_titles,
-    run_checks,
-)
-from qw.design_stages.main import (
-    DESIGN_STAGE_CLASSES,
-    get_design_stage_class_from_name,
-    get_local_stages,
-    get_remote_stages,
-)
-from qw.local_store.keyring import get_qw_password, set_qw_password
-from qw.local_store.main import LocalStore
-from qw.mergedoc import load_template
-from qw.remote_repo.factory import get_service
+from qw.local_store.types import ReleaseTemplateSet
 from qw.remote_repo.service import (
     Service,
     get_repo_url,
@@ -46,6 +25,15 @@ from qw.remote_repo.service import (
     remote_address_to_host_user_repo,
 )
 
+if TYPE_CHECKING:
+    from qw.design_stages._base import DesignBase
+    from qw.design_stages.checks import CheckImpact, CheckResult
+    from qw.local_store.main import LocalStore
+
+# Modules that are slow to import (such as git, rich, python-docx, the
+# remote service clients and the design stages) are imported by the
+# commands that use them, so that `qw --help` and argument errors are fast.
+
 app = typer.Typer()
 
 
@@ -66,19 +54,19 @@ class LogLevel(str, Enum):
         return self.value
 
 
-LOGLEVEL_TO_LOGURU = {
-    LogLevel.DEBUG: 10,
-    LogLevel.INFO: 20,
-    LogLevel.WARNING: 30,
-    LogLevel.ERROR: 40,
-}
+@functools.lru_cache(maxsize=1)
+def _store() -> "LocalStore":
+    """Create the local store the first time a command needs it."""
+    from qw.local_store.main import LocalStore
 
-store = LocalStore()
+    return LocalStore()
 
 
 def _build_and_check_service(conf: dict | None = None):
+    from qw.remote_repo.factory import get_service
+
     if conf is None:
-        conf = store.read_configuration()
+        conf = _store().read_configuration()
     service = get_service(conf)
     service.check()
     typer.echo("Can connect to the remote repository 🎉")
@@ -88,6 +76,8 @@ def _build_and_check_service(conf: dict | None = None):
 def version_callback(value):
     """Print the version and exit."""
     if value:
+        from rich.console import Console
+
         Console().print(f"qw version: [cyan]{__version__}[/]", highlight=False)
         raise typer.Exit
 
@@ -98,6 +88,7 @@ def main(
         Optional[bool],
         typer.Option(
             "--version",
+            "-V",
             help="Print the version and exit",
             callback=version_callback,
             is_eager=True,
@@ -130,15 +121,14 @@ def main(
     Processes the options passed before the command.
     """
     logger.remove()
-    logfilter = {"": True}
-    if logmodule is not None and len(logmodule) != 0:
-        logfilter = {"": False}
-        for lm in logmodule:
-            logfilter[lm] = True
+    # loguru applies each entry to the named module and its submodules
+    logfilter = {"": not logmodule, **dict.fromkeys(logmodule or (), True)}
     logger.add(
         sys.stderr,
-        level=LOGLEVEL_TO_LOGURU[loglevel],
+        level=loglevel.name,
         filter=logfilter,
+        backtrace=False,
+        diagnose=False,
     )
 
 
@@ -167,17 +157,23 @@ def init(
     ] = False,
 ) -> None:
     """Initialize this tool and the repository (as far as possible)."""
-    gitrepo = git.Repo(store.base_dir)
+    import git
+
+    gitrepo = git.Repo(_store().base_dir)
     repo = get_repo_url(gitrepo, repo)
-    store.get_or_create_qw_dir(force=force)
+    _store().get_or_create_qw_dir(force=force)
     (host, username, reponame) = remote_address_to_host_user_repo(repo)
     if service is None:
         service = hostname_to_service(host)
-    store.initialise_qw_files(repo, reponame, service, username)
+    _store().initialise_qw_files(repo, reponame, service, username)
 
 
-def get_check_impact_configuration(local_store: LocalStore) -> dict[str, CheckImpact]:
+def get_check_impact_configuration(
+    local_store: "LocalStore",
+) -> dict[str, "CheckImpact"]:
     """Read .qw/conf.json and extract the 'checks' property."""
+    from qw.design_stages.checks import CheckImpact, get_check_titles
+
     conf = local_store.read_configuration()
     title_set = set(get_check_titles())
     impacts = {}
@@ -203,11 +199,13 @@ def get_check_impact_configuration(local_store: LocalStore) -> dict[str, CheckIm
 
 
 def run_checks_with_impacts(
-    local_store: LocalStore,
-    stages: list[type[DesignBase]],
+    local_store: "LocalStore",
+    stages: list[type["DesignBase"]],
     **_kwargs,
-) -> CheckResult:
+) -> "CheckResult":
     """Run all the checks over `stages`, taking the impact configuration from `local_store`."""
+    from qw.design_stages.checks import run_checks
+
     impacts = get_check_impact_configuration(local_store)
     return run_checks(stages, impacts=impacts, **_kwargs)
 
@@ -261,7 +259,20 @@ def check(
     ] = False,
 ) -> None:
     """Check issue or pull request for any QW problems."""
+    if issue and review_request:
+        msg = (
+            "Check should only be run on an issue or a review_request,"
+            " not both at the same time"
+        )
+        raise QwError(msg)
+
+    from qw.design_stages.main import get_local_stages, get_remote_stages
+
     kwargs = {}
+    if issue is not None:
+        kwargs["issues"] = {issue}
+    if review_request is not None:
+        kwargs["prs"] = {review_request}
     if token and repository:
         logger.info("Using CI access token for authorisation")
         (host, username, reponame) = remote_address_to_host_user_repo(repository)
@@ -274,26 +285,16 @@ def check(
                 "token": token,
             },
         )
-        stages = get_remote_stages(service)
+        stages = get_remote_stages(service, **kwargs)
     elif remote:
         service = _build_and_check_service()
-        stages = get_remote_stages(service)
+        stages = get_remote_stages(service, **kwargs)
     else:
         logger.info("Using local qw config for authorisation.")
-        stages = get_local_stages(store)
+        stages = get_local_stages(_store())
     # currently dummy function as doesn't need real functionality for configuration
-    if issue and review_request:
-        QwError(
-            "Check should only be run on an issue or a review_request, not both at the same time",
-        )
-    if not (issue or review_request):
-        QwError("Nothing given to check, please add a issue or review_request to check")
-    if issue is not None:
-        kwargs["issues"] = {issue}
-    if review_request is not None:
-        kwargs["prs"] = {review_request}
     result = run_checks_with_impacts(
-        store,
+        _store(),
         stages,
         **kwargs,
     )
@@ -331,21 +332,23 @@ def login(
     ] = False,
 ):
     """Add access credentials for the remote repository."""
-    conf = store.read_configuration()
+    from qw.local_store.keyring import get_qw_password, set_qw_password
+
+    conf = _store().read_configuration()
     existing_access_token = get_qw_password(conf["user_name"], conf["repo_name"])
 
     if existing_access_token and not force:
         typer.echo(
             "Access token already exists, rerun with '--force' if you want to override it.",
         )
-    else:
-        access_token = Prompt.ask(
-            f"Please copy the access token for {conf['service']}",
-        )
-
-        set_qw_password(conf["user_name"], conf["repo_name"], access_token)
+        return
 
-    _build_and_check_service()
+    access_token = typer.prompt(
+        f"Please copy the access token for {conf['service']}",
+        hide_input=True,
+    )
+    set_qw_password(conf["user_name"], conf["repo_name"], access_token)
+    _build_and_check_service(conf)
 
 
 @app.command()
@@ -358,21 +361,40 @@ def freeze(
             help="Report differences but do not store the results.",
         ),
     ] = False,
+    no_cache: Annotated[
+        Optional[bool],
+        typer.Option(
+            "--no-cache",
+            help="Fetch every remote design stage, even if they seem unchanged.",
+        ),
+    ] = False,
 ):
     """Freeze the state of remote design stages and update local store."""
-    conf = store.read_configuration()
+    from qw.changes import ChangeHandler, LocalChangeNone
+    from qw.remote_repo.factory import get_service
+
+    conf = _store().read_configuration()
     service = get_service(conf)
-    change_handler = ChangeHandler(service, store)
+    change_handler = ChangeHandler(service, _store(), use_cache=not no_cache)
     diff_elements = change_handler.diff_remote_and_local_items()
-    determiner = LocalChangeNone() if dry_run else LocalChangeInteractive()
+    if all(diff_element.is_unchanged() for diff_element in diff_elements):
+        logger.info("Local store is already up to date")
+        return
+    determiner = (
+        LocalChangeNone()
+        if dry_run
+        else change_handler.get_interactive_determiner(diff_elements)
+    )
     to_save = change_handler.get_local_items_from_diffs(
         diff_elements,
         determiner,
     )
     if dry_run:
+        # Exhaust the items so each difference is reported, storing nothing
+        deque(to_save, maxlen=0)
         logger.info("Finished freeze (dry run)")
     else:
-        store.write_local_data([x.to_dict() for x in to_save])
+        _store().write_local_data(x.to_dict() for x in to_save)
         logger.info("Finished freeze")
 
 
@@ -406,7 +428,7 @@ def configure(
         ),
     ] = False,
     release_templates: Annotated[
-        list[LocalStore.ReleaseTemplateSet],
+        list[ReleaseTemplateSet],
         typer.Option(
             help=(
                 "Release file template sets to install in qw_release_templates"
@@ -427,10 +449,10 @@ def configure(
     service = _build_and_check_service()
     repo_updated = False
     if workflow:
-        store.write_templates_and_ci(service, force=force)
+        _store().write_templates_and_ci(service, force=force)
         repo_updated = True
     for template_set in release_templates:
-        store.write_release_document_templates(
+        _store().write_release_document_templates(
             service,
             template_set,
             force=force,
@@ -475,24 +497,26 @@ def generate_merge_fields(
     click "Insert field". You can leave this dialog open and insert more
     fields as you edit the document.
     """
-    headings = []
-    examples = []
-    for cls in DESIGN_STAGE_CLASSES:
-        name = cls.design_stage.value
-        fields = cls.base_fields | cls.not_required_fields
-        for f in fields:
-            field = f"{name}.{f}"
-            headings.append(field)
-            examples.append(f"<{field}>")
-    with output.open("w") as out:
-        out.write("\n".join([",".join(line) for line in [headings, examples]]))
+    from qw.design_stages.main import DESIGN_STAGE_CLASSES
+
+    headings = [
+        f"{cls.design_stage.value}.{f}"
+        for cls in DESIGN_STAGE_CLASSES
+        for f in sorted(cls.all_fields)
+    ]
+    with output.open("w", newline="") as out:
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(headings)
+        writer.writerow(f"<{field}>" for field in headings)
 
 
 @app.command()
 def release():
     """Produce documentation by merging frozen values into templates."""
+    from qw.mergedoc import load_template
+
     data = _get_merge_data()
-    for wt_path, wt_out in store.release_word_templates():
+    for wt_path, wt_out in _store().release_word_templates():
         doc = load_template(wt_path)
         doc.write(
             output_file=wt_out,
@@ -507,6 +531,8 @@ def filter_data_references(from_obj_type, from_objs, to_obj_type, to_obj):
 
     Finds the objects in the from_objs iterable that refer to to_obj.
     """
+    from qw.design_stages.main import get_design_stage_class_from_name
+
     to_obj_class = get_design_stage_class_from_name(to_obj_type)
     if to_obj_class is None:
         return None
@@ -519,25 +545,69 @@ def filter_data_references(from_obj_type, from_objs, to_obj_type, to_obj):
 
 def _get_merge_data() -> dict[str, list[dict[str, Any]]]:
     """Fetch frozen data for MS Word merge."""
-    stages = get_local_stages(store)
-    data: dict[str, list[dict[str, Any]]] = {}
-    for s in stages:
-        sd = s.to_dict()
-        typ = sd["stage"].value
-        if typ not in data:
-            data[typ] = []
-        data[typ].append(sd)
-    return data
+    from qw.design_stages.main import get_local_stages
+
+    data: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    for s in get_local_stages(_store()):
+        data[s.design_stage.value].append(s.to_dict())
+    return dict(data)
+
+
+_GLOBAL_OPTIONS_WITH_VALUE = frozenset({"--loglevel", "--logmodule"})
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """
+    Find the name of the command to be run, skipping global options.
+
+    :param argv: the command line arguments, without the program name
+    :return: the first argument that is not a global option, or None
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in _GLOBAL_OPTIONS_WITH_VALUE:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _app_for_command(name: str | None) -> typer.Typer:
+    """
+    Get an app with only the named command registered.
+
+    Typer builds the options of every registered command when it is
+    run, so registering just the one that is needed saves that work.
+    Help and unknown commands get the full app.
+    """
+    commands = {
+        command.name or command.callback.__name__.replace("_", "-"): command
+        for command in app.registered_commands
+        if command.callback is not None
+    }
+    if name not in commands:
+        return app
+    command_app = typer.Typer()
+    command_app.registered_callback = app.registered_callback
+    command_app.registered_commands = [commands[name]]
+    return command_app
 
 
 def run_app():
     """Run the app, reporting errors nicely."""
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        # Answer without building the app or importing rich.
+        sys.stdout.write(f"qw version: {__version__}\n")
+        sys.exit(0)
     try:
-        app()
+        _app_for_command(_sniff_subcommand(sys.argv[1:]))()
         sys.exit(0)
     except QwError as e:
         sys.stderr.write(str(e) + "\n")
         sys.exit(2)
+    except KeyboardInterrupt:
+        sys.stderr.write("\n")
+        sys.exit(130)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,6 @@
 import re
 from abc import ABC
 from collections.abc import Callable
-from copy import copy
 from typing import Any, Self
 
 from qw.base import QwError
@@ -17,9 +16,19 @@ class DesignBase(ABC):
     base_fields: frozenset[str] = frozenset(
         ["title", "description", "internal_id", "version"],
     )
+    # base_fields and not_required_fields together, worked out for each subclass
+    all_fields: frozenset[str] = base_fields
+    # fields _validate_required_fields skips, worked out for each subclass
+    unvalidated_fields: frozenset[str] = frozenset(["not_required_fields"])
     design_stage: DesignStage | None = None
 
-    LINK_RE = re.compile(r"#(\d+)")
+    LINK_RE = re.compile(r"#(\d+)", re.ASCII)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Combine the fields of the subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.all_fields = cls.base_fields | cls.not_required_fields
+        cls.unvalidated_fields = cls.not_required_fields | {"not_required_fields"}
 
     def __init__(self) -> None:
         """Shared fields for all design stage classes."""
@@ -35,9 +44,8 @@ class DesignBase(ABC):
         return f"<{self.__class__.__name__} #{self.internal_id}: {self.title}>"
 
     def _validate_required_fields(self):
-        not_required = ["not_required_fields", *self.not_required_fields]
         for field, value in self.__dict__.items():
-            if field in not_required:
+            if field in self.unvalidated_fields:
                 continue
             if not value:
                 msg = f"No {field} in {self.__class__.__name__}"
@@ -47,7 +55,7 @@ class DesignBase(ABC):
         """Get #IDs contained in text."""
         if text is None:
             return []
-        return [int(match) for match in self.LINK_RE.findall(text)]
+        return [int(match[1]) for match in self.LINK_RE.finditer(text)]
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -57,7 +65,7 @@ class DesignBase(ABC):
 
         :return: JSON representation of class
         """
-        return copy(self.__dict__)
+        return self.__dict__.copy()
 
     @classmethod
     def from_dict(cls, input_dict: dict[str, Any]) -> Self:
@@ -110,11 +118,27 @@ class DesignBase(ABC):
         :raises ValueError: if other is not the same class as self.
         :return: A dictionary with each field that was different, with the `self` and `other` string values.
         """
+        return {
+            field_name: {"self": self_value, "other": other_value}
+            for field_name, self_value, other_value in self.diff_rows(other)
+        }
+
+    def diff_rows(self, other: Self) -> tuple[tuple[str, str, str], ...]:
+        """
+        Compare the data of each field with another instance, as `diff` does.
+
+        :param other: Another instance of the same class
+        :raises ValueError: if other is not the same class as self.
+        :return: A (field name, `self` string value, `other` string value)
+        row for each field that was different.
+        """
         if not isinstance(other, type(self)):
             msg = "Instances must be of the same class type."
             raise ValueError(msg)
+        if self.__dict__ == other.__dict__:
+            return ()
 
-        output_fields = {}
+        rows = []
         for field_name in self.__dict__:
             if field_name in ["version", "deleted"]:
                 continue
@@ -122,13 +146,12 @@ class DesignBase(ABC):
             other_data = getattr(other, field_name)
 
             if self_data != other_data:
-                output_fields[field_name] = {"self": str(self_data)}
-                output_fields[field_name]["other"] = str(other_data)
+                rows.append((field_name, str(self_data), str(other_data)))
 
-        return output_fields
+        return tuple(rows)
 
     def mark_as_deleted(self):
         self.deleted = True
 
     def is_marked_deleted(self):
-        return hasattr(self, "deleted") and self.deleted
+        return self.__dict__.get("deleted", False)
@@ -103,10 +103,11 @@ def run_checks(
     """
     if impacts is None:
         impacts = {}
-    class_dict_args: dict[str, dict[int, type[DesignBase]]] = {}
-    for stage_class in DesignBase.__subclasses__():
-        class_dict_args[stage_class.plural] = {}
-    # Create the arguments the checks might use
+    # Create the arguments the checks might use; every plural is passed,
+    # even with no stages, as checks take them as required keywords
+    class_dict_args: dict[str, dict[int, type[DesignBase]]] = {
+        stage_class.plural: {} for stage_class in DesignBase.__subclasses__()
+    }
     for stage in stages:
         class_dict_args[stage.plural][stage.internal_id] = stage
     # Find the stages we actually want to test
@@ -132,22 +133,20 @@ def run_checks(
 
 def get_wanted_stages(stages, issues, prs) -> list[DesignBase]:
     """Get all DesignStages from `issues` and `prs` whose ids exist in `stages`."""
-    wanted: list[DesignBase] = []
     if prs is None and issues is None:
-        wanted = stages
-        logger.debug("All stages ({})", len(wanted))
-    else:
-        if prs is None:
-            prs = set()
-        if issues is None:
-            issues = set()
-        for stage in stages:
-            if stage.remote_item_type == RemoteItemType.REQUEST:
-                if stage.internal_id in prs:
-                    wanted.append(stage)
-            elif stage.internal_id in issues:
-                wanted.append(stage)
-    return wanted
+        logger.debug("All stages ({})", len(stages))
+        return stages
+    if prs is None:
+        prs = set()
+    if issues is None:
+        issues = set()
+    # Enum members are singletons, so `is` avoids calling str.__eq__
+    return [
+        stage
+        for stage in stages
+        if stage.internal_id
+        in (prs if stage.remote_item_type is RemoteItemType.REQUEST else issues)
+    ]
 
 
 def get_check_titles():
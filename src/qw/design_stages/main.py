@@ -1,4 +1,6 @@
 """Data types representing each design stage and functions to interact with them."""
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Any, Self
 
 from loguru import logger
@@ -223,13 +225,14 @@ _DESIGN_STAGE_CLASS_FROM_NAME = {
 
 def get_design_stage_class_from_name(name: str) -> type[DesignBase] | None:
     """Get the subclass of DesignBase from a DesignStage enum value."""
-    if name in _DESIGN_STAGE_CLASS_FROM_NAME:
-        return _DESIGN_STAGE_CLASS_FROM_NAME[name]
-    return None
+    return _DESIGN_STAGE_CLASS_FROM_NAME.get(name)
 
 
 DesignStages = list[UserNeed | Requirement | DesignOutput]
 
+# Number of threads used to fetch individually requested issues and PRs
+REMOTE_FETCH_WORKERS = 32
+
 
 def get_local_stages(local_store: LocalStore) -> DesignStages:
     """
@@ -239,7 +242,17 @@ def get_local_stages(local_store: LocalStore) -> DesignStages:
     :raises QwError: if a stage is unknown or has not been implemented
     :return: instances of classes, deserialised from local store
     """
-    data_items = local_store.read_local_data()
+    return build_design_stages(local_store.read_local_data())
+
+
+def build_design_stages(data_items: list[dict[str, Any]]) -> DesignStages:
+    """
+    Build design stages from their dictionary representations.
+
+    :param data_items: design stages serialised with `to_dict`
+    :raises QwError: if a stage is unknown or has not been implemented
+    :return: instances of classes, deserialised from the dictionaries
+    """
     output = []
     for data_item in data_items:
         output.append(_build_design_stage_or_throw(data_item))
@@ -263,47 +276,99 @@ def _build_design_stage_or_throw(data_item: dict[str, Any]):
     raise QwError(not_implemented)
 
 
-def get_remote_stages(service: Service) -> DesignStages:
+def _stage_from_issue(issue: Issue) -> UserNeed | Requirement | None:
+    """Build the design stage for an issue, or None if it is not one."""
+    labels = issue.labels
+    if "qw-ignore" in labels:
+        logger.debug(
+            "Issue {number} tagged to be ignored, skipping",
+            number=issue.number,
+        )
+        return None
+    if "qw-user-need" in labels:
+        logger.debug("User Need #{}", issue.number)
+        return UserNeed.from_issue(issue)
+    if "qw-requirement" in labels:
+        logger.debug("Requirement #{}", issue.number)
+        return Requirement.from_issue(issue)
+    logger.debug(
+        "#{} is neither a User Need nor a Requirement",
+        issue.number,
+    )
+    return None
+
+
+def _stage_from_pr(pr: PullRequest) -> DesignOutput | None:
+    """Build the design output for a pull request, or None if it is not one."""
+    if "qw-ignore" in pr.labels:
+        logger.debug(
+            "PR {number} tagged to be ignored, skipping",
+            number=pr.number,
+        )
+        return None
+    if pr.changes_only_qw():
+        logger.debug(
+            "PR {number} only affects qw data, skipping",
+            number=pr.number,
+        )
+        return None
+    logger.debug("PR #{} added", pr.number)
+    return DesignOutput.from_pr(pr)
+
+
+def get_remote_stages(
+    service: Service,
+    issues: set[int] | None = None,
+    prs: set[int] | None = None,
+) -> DesignStages:
     """
     Build design stages from a given remote service.
 
+    The output is in the same order as the issues and pull requests in
+    the service.
+
+    If issues or prs are given, only those and the issues they link to
+    are fetched, which is all that checking them needs.
+
     :param service: instance of a service for a remote repo.
+    :param issues: numbers of the issues wanted, if not all of them.
+    :param prs: numbers of the pull requests wanted, if not all of them.
     :return: all designs stages
     """
-    output_stages = []
-    for issue in service.issues:
-        if "qw-ignore" in issue.labels:
-            logger.debug(
-                "Issue {number} tagged to be ignored, skipping",
-                number=issue.number,
-            )
-            continue
-        # Could have multiple design stages from the same pull request
-        # so allow multiple outputs from a single issue
-        if "qw-user-need" in issue.labels:
-            logger.debug("User Need #{}", issue.number)
-            output_stages.append(UserNeed.from_issue(issue))
-        elif "qw-requirement" in issue.labels:
-            logger.debug("Requirement #{}", issue.number)
-            output_stages.append(Requirement.from_issue(issue))
-        else:
-            logger.debug(
-                "#{} is neither a User Need nor a Requirement",
-                issue.number,
-            )
-    for pr in service.pull_requests:
-        if "qw-ignore" in pr.labels:
-            logger.debug(
-                "PR {number} tagged to be ignored, skipping",
-                number=pr.number,
-            )
-            continue
-        if pr.changes_only_qw():
-            logger.debug(
-                "PR {number} only affects qw data, skipping",
-                number=pr.number,
-            )
-            continue
-        output_stages.append(DesignOutput.from_pr(pr))
-        logger.debug("PR #{} added", pr.number)
-    return output_stages
+    if issues is not None or prs is not None:
+        return _get_linked_remote_stages(service, issues or set(), prs or set())
+    issue_stages = map(_stage_from_issue, service.issues)
+    pr_stages = map(_stage_from_pr, service.pull_requests)
+    return [stage for stage in chain(issue_stages, pr_stages) if stage is not None]
+
+
+def _get_linked_remote_stages(
+    service: Service,
+    issues: set[int],
+    prs: set[int],
+) -> DesignStages:
+    """Build the numbered design stages and the issue stages they link to."""
+
+    def issue_stage(number: int) -> UserNeed | Requirement | None:
+        issue = service.get_issue(number)
+        return None if issue is None else _stage_from_issue(issue)
+
+    def pr_stage(number: int) -> DesignOutput | None:
+        pr = service.get_pull_request(number)
+        return None if pr is None else _stage_from_pr(pr)
+
+    with ThreadPoolExecutor(max_workers=REMOTE_FETCH_WORKERS) as executor:
+        issue_stages = executor.map(issue_stage, sorted(issues))
+        pr_stages = [s for s in executor.map(pr_stage, sorted(prs)) if s is not None]
+        stages: DesignStages = [s for s in issue_stages if s is not None]
+        linked = set()
+        for stage in chain(stages, pr_stages):
+            if isinstance(stage, Requirement):
+                linked.update(stage.user_need_links())
+            elif isinstance(stage, DesignOutput):
+                linked.update(stage.closing_issues)
+        linked.difference_update(issues)
+        stages.extend(
+            s for s in executor.map(issue_stage, sorted(linked)) if s is not None
+        )
+    return sorted(stages, key=lambda stage: stage.internal_id) + pr_stages
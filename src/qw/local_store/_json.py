@@ -4,15 +4,66 @@ JSON interaction, in case we want to change libraries or implementation.
 All reading and writing used UTF-8 to ensure consistency between windows and unix.
 """
 
-import json
+import re
+from collections.abc import Iterable
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
 
+import orjson
+
 
 def _load_json(path: Path) -> dict | list[dict]:
-    with path.open(encoding="utf-8") as handle:
-        return json.load(handle)
+    return orjson.loads(path.read_bytes())
+
+
+_DUMP_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+
+# Characters that json.dumps escapes but orjson does not, which can only
+# be inside strings in the JSON
+_UNESCAPED = re.compile(r"[^\x00-\x7e]+")
+
+
+def _dumps(data: dict | list[dict]) -> bytes:
+    """
+    Encode data as `json.dumps(data, sort_keys=True, indent=2)` does.
+
+    orjson writes non-ASCII characters (and DEL) unescaped, so they are
+    escaped afterwards to keep the files the same as the json module
+    wrote them.
+    """
+    text = orjson.dumps(data, option=_DUMP_OPTIONS)
+    if text.isascii() and b"\x7f" not in text:
+        return text
+    return _UNESCAPED.sub(
+        lambda match: encode_basestring_ascii(match.group())[1:-1],
+        text.decode("utf-8"),
+    ).encode("ascii")
 
 
 def _dump_json(data: dict | list[dict], path: Path) -> None:
-    with path.open("w", encoding="utf-8") as conf_file:
-        json.dump(data, conf_file, sort_keys=True, indent=2)
+    path.write_bytes(_dumps(data))
+
+
+def _dump_json_list(items: Iterable[dict], path: Path) -> None:
+    """
+    Write items to a JSON list as they are produced.
+
+    The output is the same as `_dump_json` of the whole list. It is
+    written to a temporary file that replaces `path` once all the items
+    have been written, so `path` is left as it was if we are interrupted.
+    """
+    temp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with temp_path.open("wb") as handle:
+            separator = b"[\n"
+            for item in items:
+                handle.write(separator)
+                text = _dumps(item)
+                handle.write(b"\n".join(b"  " + line for line in text.split(b"\n")))
+                separator = b",\n"
+            handle.write(b"[]" if separator == b"[\n" else b"\n]")
+    except BaseException:
+        # Including KeyboardInterrupt or EOF at a prompt producing the items
+        temp_path.unlink(missing_ok=True)
+        raise
+    temp_path.replace(path)
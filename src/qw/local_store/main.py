@@ -2,7 +2,8 @@
 import os
 import pathlib
 import shutil
-from enum import Enum
+import stat
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,12 +11,13 @@ from loguru import logger
 
 from qw.base import QwError
 from qw.design_stages.checks import get_check_titles
-from qw.local_store._json import _dump_json, _load_json
+from qw.local_store._json import _dump_json, _dump_json_list, _load_json
 from qw.local_store._repository import (
     FailingRequirementComponents,
     QwDirRequirementComponents,
 )
 from qw.local_store.directories import find_git_base_dir
+from qw.local_store.types import ReleaseTemplateSet
 from qw.remote_repo.service import GitService, Service
 
 if TYPE_CHECKING:
@@ -27,21 +29,15 @@ class LocalStore:
 
     _config_file = "conf.json"
     _data_file = "store.json"
+    _cache_dir = "cache"
+    _remote_cache_file = "remote_stages.json"
     _release_template_dir = "qw_release_templates"
 
-    class ReleaseTemplateSet(Enum):
-        """
-        Sets of documents that can be automatically installed.
-
-        The idea is that we can have a set for each different standard
-        we want to conform to, plus others for management.
-        """
-
-        Basic = "basic"
-
     def __init__(self, base_dir: Path | None = None):
         """Find base dir if not defined."""
         self.base_dir = base_dir if base_dir else find_git_base_dir()
+        self._configuration: dict | None = None
+        self._configuration_mtime: int | None = None
         if self.base_dir is None:
             self.qw_dir = None
             self._requirement_component = FailingRequirementComponents(
@@ -67,6 +63,13 @@ class LocalStore:
             raise QwError(msg)
         return self.qw_dir / self._data_file
 
+    @property
+    def _remote_cache_path(self) -> pathlib.Path:
+        if self.qw_dir is None:
+            msg = "qw is not initialized, please run qw init"
+            raise QwError(msg)
+        return self.qw_dir / self._cache_dir / self._remote_cache_file
+
     def get_qw_dir(self) -> pathlib.Path:
         """Get the .qw directory path."""
         r = self.qw_dir
@@ -84,10 +87,14 @@ class LocalStore:
         """
         qw_dir = self.get_qw_dir()
         logger.debug(".qw directory is '{dir}'", dir=self.qw_dir)
-        if qw_dir.is_file():
+        try:
+            mode = qw_dir.stat().st_mode
+        except FileNotFoundError:
+            mode = None
+        if mode is not None and stat.S_ISREG(mode):
             msg = ".qw file exists, which is blocking us from making a .qw directory. Please delete it!"
             raise QwError(msg)
-        if not qw_dir.is_dir():
+        if mode is None or not stat.S_ISDIR(mode):
             qw_dir.mkdir()
         elif not force:
             msg = ".qw directory already exists! Use existing configuration or use --force flag to reinitialize!"
@@ -95,11 +102,21 @@ class LocalStore:
         return qw_dir
 
     def read_configuration(self) -> dict:
-        """Get the configuration (as a dict) from the .qw/conf.json file."""
-        if not self._config_path.is_file():
+        """
+        Get the configuration (as a dict) from the .qw/conf.json file.
+
+        The parsed configuration is kept and returned again until the
+        file is modified, so callers should not change it.
+        """
+        try:
+            mtime = self._config_path.stat().st_mtime_ns
+        except FileNotFoundError as exception:
             msg = "Could not find a configuration directory, please initialize with `qw init`"
-            raise QwError(msg)
-        return _load_json(self._config_path)
+            raise QwError(msg) from exception
+        if self._configuration is None or self._configuration_mtime != mtime:
+            self._configuration = _load_json(self._config_path)
+            self._configuration_mtime = mtime
+        return self._configuration
 
     def read_local_data(self) -> list[dict]:
         """Read persisted data stages."""
@@ -138,10 +155,39 @@ class LocalStore:
             "checks": self._get_default_check_impacts(),
         }
         _dump_json(conf, self._config_path)
+        self._configuration = None
+
+    def write_local_data(self, data: Iterable[dict]):
+        """Write to local data file, consuming `data` as it is written."""
+        _dump_json_list(data, self._data_path)
+
+    def head_commit(self) -> str | None:
+        """Get the SHA of the local repository's HEAD commit, if there is one."""
+        import git
 
-    def write_local_data(self, data: list[dict]):
-        """Write to local data file."""
-        _dump_json(data, self._data_path)
+        try:
+            return git.Repo(self.base_dir).head.commit.hexsha
+        except (git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError):
+            return None
+
+    def read_remote_cache(self) -> dict | None:
+        """Read the cached remote data stages, if any have been written."""
+        if not self._remote_cache_path.is_file():
+            return None
+        return _load_json(self._remote_cache_path)
+
+    def write_remote_cache(self, cache: dict):
+        """
+        Write the remote data stages cache.
+
+        The cache directory is ignored by git, as it is only useful
+        to this checkout.
+        """
+        cache_dir = self._remote_cache_path.parent
+        if not cache_dir.is_dir():
+            cache_dir.mkdir()
+            (cache_dir / ".gitignore").write_text("*\n")
+        _dump_json(cache, self._remote_cache_path)
 
     def write_templates_and_ci(self, service: GitService, *, force: bool):
         """Write templates and CI configuration to local repository."""
@@ -0,0 +1,13 @@
+"""Lightweight types used by the local store and the command line."""
+from enum import Enum
+
+
+class ReleaseTemplateSet(Enum):
+    """
+    Sets of documents that can be automatically installed.
+
+    The idea is that we can have a set for each different standard
+    we want to conform to, plus others for management.
+    """
+
+    Basic = "basic"
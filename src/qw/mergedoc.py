@@ -268,7 +268,7 @@ class Document:
         """
         logger.debug("Starting section")
         while section.next_section():
-            logger.debug(f"section {section.start_index}-{section.end_index}")
+            logger.debug("section {}-{}", section.start_index, section.end_index)
             fs = section.fields()
             if len(fs) == 1 and section.paragraph_is_only_field():
                 # Replace the entire section
@@ -284,7 +284,10 @@ class Document:
                 if deeper:
                     self._interpolate_sections(deeper, data.deeper_data())
             if section.at_iteration_end():
-                logger.debug(f"Resetting iterations, depth: {section._depth()}")
+                logger.opt(lazy=True).debug(
+                    "Resetting iterations, depth: {}",
+                    section._depth,
+                )
                 data.reset_iterations()
             else:
                 data.next_section()
@@ -5,7 +5,6 @@ from itertools import chain
 from pathlib import Path
 
 import github3
-import keyring
 import requests
 from github3.exceptions import AuthenticationFailed
 from jinja2 import Template
@@ -15,6 +14,7 @@ from requests import Response
 import qw.remote_repo.service
 from qw.base import QwError
 from qw.design_stages.categories import RemoteItemType
+from qw.local_store.keyring import get_qw_password
 from qw.md import text_under_heading
 
 
@@ -23,36 +23,43 @@ class Issue(qw.remote_repo.service.Issue):
 
     def __init__(
         self,
-        issue,
+        body,
+        labels,
+        number,
+        title,
+        **_kwargs,
     ) -> None:
         """
         Initialize the issue.
 
         Use service.get_issue(number) instead.
         """
-        self._issue = issue
+        self._body = body
+        self._labels = labels
+        self._number = number
+        self._title = title
 
     @property
     def number(self) -> int:
         """Get the number (human-readable ID)."""
-        return self._issue.number
+        return self._number
 
     @property
     def title(self) -> str:
         """Get the title."""
-        return self._issue.title.strip()
+        return self._title.strip()
 
     @property
     def labels(self) -> list[str]:
         """Get the label names for the issue."""
-        return [label.name for label in self._issue.labels()]
+        return [label["name"] for label in self._labels["nodes"]]
 
     @property
     def body(self) -> str:
         r"""Get the body of the first comment, always using `\n` as the newline character."""
-        if self._issue.body is None:
+        if self._body is None:
             return ""
-        return "\n".join(self._issue.body.splitlines())
+        return "\n".join(self._body.splitlines())
 
     @property
     def item_type(self) -> RemoteItemType:
@@ -126,6 +133,7 @@ class PullRequest(qw.remote_repo.service.PullRequest):
 
 LOWEST_HTTP_OK = 200
 LOWEST_HTTP_NOT_OK = 300
+HTTP_UNAUTHORIZED = 401
 
 
 def status_is_ok(status_code: int) -> bool:
@@ -139,17 +147,17 @@ class GitHubService(qw.remote_repo.service.GitService):
     def __init__(self, conf):
         """Log in with the gh auth token."""
         super().__init__(conf)
-        token = self._get_token()
-        if not token:
+        self._token = self._get_token()
+        if not self._token:
             msg = "Could not find a token in keyring."
             raise QwError(msg)
-        self.gh = github3.login(token=token)
+        self.gh = github3.login(token=self._token)
 
     def _get_token(self):
         token = self.conf.get("token", None)
         if token is not None:
             return token
-        return keyring.get_password("qw", f"{self.username}/{self.reponame}")
+        return get_qw_password(self.username, self.reponame)
 
     def _graph_ql(self, query):
         """Execute a GraphQL query, returning the response."""
@@ -162,13 +170,45 @@ class GitHubService(qw.remote_repo.service.GitService):
             },
         )
 
-    def get_issue(self, number: int) -> Issue:
-        """Get the issue with the specified number."""
-        issue = self.gh.issue(self.username, self.reponame, number)
-        return Issue(issue)
+    def get_issue(self, number: int) -> Issue | None:
+        """
+        Get the issue with the specified number, or None if there is none.
+
+        Closed issues are treated as not existing, as they are not in
+        the listing of `issues` either.
+        """
+        response = self._graph_ql(
+            f"""query {{
+repository(owner: "{self.username}", name: "{self.reponame}") {{
+    issue(number: {number}) {{
+        body
+        labels(last: 100) {{
+            nodes {{
+                name
+            }}
+        }}
+        number
+        state
+        title
+    }}
+}}
+}}""",
+        )
+        if not status_is_ok(response.status_code):
+            msg = f"Failed ({response.status_code}) to get issue #{number}"
+            raise QwError(msg)
+        result = json.loads(response.content)
+        issue = result["data"]["repository"]["issue"]
+        if issue is None:
+            logger.info("There is no issue #{}", number)
+            return None
+        if issue["state"] != "OPEN":
+            logger.info("Issue #{} is not open", number)
+            return None
+        return Issue(**issue)
 
     def get_pull_request(self, number: int) -> PullRequest | None:
-        """Get the pull request with the specified number."""
+        """Get the pull request with the specified number, or None if there is none."""
         response = self._graph_ql(
             f"""query {{
 repository(owner: "{self.username}", name: "{self.reponame}") {{
@@ -181,6 +221,11 @@ repository(owner: "{self.username}", name: "{self.reponame}") {{
                 number
             }}
         }}
+        files(first: 100) {{
+            nodes {{
+                path
+            }}
+        }}
         isDraft
         labels(last: 100) {{
             nodes {{
@@ -195,34 +240,73 @@ repository(owner: "{self.username}", name: "{self.reponame}") {{
 }}""",
         )
         if not status_is_ok(response.status_code):
-            logger.info(
-                "Failed ({}) to get the issue closing numbers for pull request #{}",
-                response.status_code,
-                number,
-            )
-            return None
+            msg = f"Failed ({response.status_code}) to get pull request #{number}"
+            raise QwError(msg)
         result = json.loads(response.content)
-        return PullRequest(**result["data"]["repository"]["pullRequest"])
+        pr = result["data"]["repository"]["pullRequest"]
+        if pr is None:
+            logger.info("There is no pull request #{}", number)
+            return None
+        return PullRequest(**pr)
 
     @property
-    def issues(self):
-        """Get all issues for the repository."""
-        return [
-            Issue(issue)
-            for issue in self.gh.issues_on(
-                self.username,
-                self.reponame,
+    def issues(self) -> list[Issue]:
+        """
+        Get all open issues for the repository.
+
+        The issues are fetched with their labels, a page of 100 at a
+        time, so no further requests are needed per issue.
+        """
+        issues: list[Issue] = []
+        after = "null"
+        while True:
+            response = self._graph_ql(
+                f"""query {{
+repository(owner: "{self.username}", name: "{self.reponame}") {{
+    issues(first: 100, after: {after}, states: OPEN) {{
+        nodes {{
+            body
+            labels(last: 100) {{
+                nodes {{
+                    name
+                }}
+            }}
+            number
+            title
+        }}
+        pageInfo {{
+            endCursor
+            hasNextPage
+        }}
+    }}
+}}
+}}""",
             )
-        ]
+            if not status_is_ok(response.status_code):
+                msg = f"Failed ({response.status_code}) to get the issues"
+                raise QwError(msg)
+            result = json.loads(response.content)
+            page = result["data"]["repository"]["issues"]
+            issues.extend(Issue(**issue) for issue in page["nodes"])
+            if not page["pageInfo"]["hasNextPage"]:
+                return issues
+            after = json.dumps(page["pageInfo"]["endCursor"])
 
     @property
     def pull_requests(self) -> list[PullRequest]:
-        """Get all pull requests for the repository."""
-        response = self._graph_ql(
-            f"""query {{
+        """
+        Get all pull requests for the repository.
+
+        The pull requests are fetched with their closing issues, files
+        and labels, a page of 100 at a time.
+        """
+        pull_requests: list[PullRequest] = []
+        after = "null"
+        while True:
+            response = self._graph_ql(
+                f"""query {{
 repository(owner: "{self.username}", name: "{self.reponame}") {{
-    pullRequests(last: 100) {{
-        totalCount
+    pullRequests(first: 100, after: {after}) {{
         nodes {{
             body
             closed
@@ -251,39 +335,103 @@ repository(owner: "{self.username}", name: "{self.reponame}") {{
             number
             title
         }}
+        pageInfo {{
+            endCursor
+            hasNextPage
+        }}
     }}
 }}
 }}""",
-        )
-        if not status_is_ok(response.status_code):
-            logger.warning(
-                "Failed ({}) to get the pull requests",
-                response.status_code,
             )
-            return []
-        result = json.loads(response.content)
-        nodes = result["data"]["repository"]["pullRequests"]
-        if len(nodes["nodes"]) < nodes["totalCount"]:
-            logger.warning(
-                "Too many pull requests! Please contact the developers.",
-            )
-        return [PullRequest(**pr) for pr in nodes["nodes"]]
+            if not status_is_ok(response.status_code):
+                msg = f"Failed ({response.status_code}) to get the pull requests"
+                raise QwError(msg)
+            result = json.loads(response.content)
+            page = result["data"]["repository"]["pullRequests"]
+            pull_requests.extend(PullRequest(**pr) for pr in page["nodes"])
+            if not page["pageInfo"]["hasNextPage"]:
+                return pull_requests
+            after = json.dumps(page["pageInfo"]["endCursor"])
 
     def check(self) -> bool:
-        """Check that the credentials can connect to the service."""
+        """
+        Check that the credentials can connect to the service.
+
+        Only the numbers of issues and pull requests are asked for, so
+        this is a single small request however big the repository is.
+        """
         try:
-            logger.info(
-                "There are currently {count} issues and PRs",
-                count=len(self.issues) + len(self.pull_requests),
+            response = self._graph_ql(
+                f"""query {{
+repository(owner: "{self.username}", name: "{self.reponame}") {{
+    issues(states: OPEN) {{
+        totalCount
+    }}
+    pullRequests {{
+        totalCount
+    }}
+}}
+}}""",
             )
-        except ConnectionError as exception:
+        except (ConnectionError, requests.ConnectionError) as exception:
             msg = "Could not connect to Github, please check internet connection"
             raise QwError(msg) from exception
         except AuthenticationFailed as exception:
             msg = "Could not connect to Github, please check that your access token is correct and has not expired"
             raise QwError(msg) from exception
+        if response.status_code == HTTP_UNAUTHORIZED:
+            msg = "Could not connect to Github, please check that your access token is correct and has not expired"
+            raise QwError(msg)
+        if not status_is_ok(response.status_code):
+            msg = f"Failed ({response.status_code}) to connect to Github"
+            raise QwError(msg)
+        repository = json.loads(response.content)["data"]["repository"]
+        if repository is None:
+            msg = f"Could not find the repository {self.full_name} on Github"
+            raise QwError(msg)
+        logger.info(
+            "There are currently {count} issues and PRs",
+            count=repository["issues"]["totalCount"]
+            + repository["pullRequests"]["totalCount"],
+        )
         return True
 
+    def get_remote_fingerprint(self) -> str | None:
+        """
+        Get the numbers of open issues and pull requests, and when each was last updated.
+
+        Editing an issue or pull request changes the newest update time,
+        while closing, deleting or transferring one changes the count,
+        so any change to the remote stages changes the result. This is
+        a single small request however big the repository is.
+        """
+        response = self._graph_ql(
+            f"""query {{
+repository(owner: "{self.username}", name: "{self.reponame}") {{
+    issues(first: 1, states: OPEN, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+        totalCount
+        nodes {{
+            updatedAt
+        }}
+    }}
+    pullRequests(first: 1, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+        totalCount
+        nodes {{
+            updatedAt
+        }}
+    }}
+}}
+}}""",
+        )
+        if not status_is_ok(response.status_code):
+            logger.debug(
+                "Failed ({}) to get the state of the issues",
+                response.status_code,
+            )
+            return None
+        repository = json.loads(response.content)["data"]["repository"]
+        return json.dumps(repository, sort_keys=True)
+
     @property
     def template_paths(self) -> Iterable[Path]:
         """Paths for templates to copy to the service."""
@@ -361,13 +509,10 @@ repository(owner: "{self.username}", name: "{self.reponame}") {{
         json_bundle = json.loads(json_text)
 
         # POST ruleset to GitHub
-        ruleset_url = (
-            f"https://api.github.com/repos/{self.username}/{self.reponame}/rulesets"
-        )
-        token = self._get_token()
+        ruleset_url = f"https://api.github.com/repos/{self.full_name}/rulesets"
         headers = {
             "Accept": "application/vnd.github+json",
-            "Authorization": f"Bearer {token}",
+            "Authorization": f"Bearer {self._token}",
             "X-GitHub-Api-Version": "2022-11-28",
         }
         if not force:
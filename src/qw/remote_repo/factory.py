@@ -12,7 +12,7 @@ def get_service(conf: dict | None = None) -> GitService:
     """Return a git hosting service."""
     if conf is None:
         store = LocalStore()
-        conf = store.get_configuration()
+        conf = store.read_configuration()
     name = conf.get("service", None)
     if name is None:
         msg = "Configuration is corrupt. Please run `qw init`"
@@ -10,14 +10,17 @@ import re
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
-
-import git
+from typing import TYPE_CHECKING
 
 import qw.resources
 from qw.base import QwError
 from qw.design_stages.categories import RemoteItemType
 
+if TYPE_CHECKING:
+    import git
+
 
 class Service(str, Enum):
     """Git hosting service identifiers."""
@@ -27,27 +30,29 @@ class Service(str, Enum):
     GITLAB = "gitlab"
 
 
-def get_repo_url(repo: git.Repo, name: str) -> str:
+def get_repo_url(repo: "git.Repo", name: str) -> str:
     """
     Get the repo URL.
 
     Find the URL of the repo given the --repo=<> command-line
     option and the git remotes configured.
     """
+    # Each access of repo.remotes reads the git configuration again
+    remotes = repo.remotes
     if name is None:
         for remote_name in ["upstream", "origin"]:
-            if remote_name in repo.remotes:
-                return repo.remotes[remote_name].url
+            if remote_name in remotes:
+                return remotes[remote_name].url
         msg = "No repo name supplied, and no remote called upstream or origin."
         raise QwError(
             msg,
         )
-    if name in repo.remotes:
-        return repo.remotes[name].url
-    for remote in repo.remotes:
-        if remote.url == repo:
-            return repo
-    msg = f"The supplied repo '{repo}' is neither the name or url of a known remote."
+    if name in remotes:
+        return remotes[name].url
+    for remote in remotes:
+        if remote.url == name:
+            return name
+    msg = f"The supplied repo '{name}' is neither the name or url of a known remote."
     raise QwError(
         msg,
     )
@@ -102,8 +107,7 @@ def remote_address_to_host_user_repo(
     uh = splitstr(host, "@", 2)
     if uh is not None:
         host = uh[1]
-    repo = re.sub(r"\.git$", "", repo_raw)
-    return (host, user, repo)
+    return (host, user, repo_raw.removesuffix(".git"))
 
 
 def hostname_to_service(hostname: str) -> str:
@@ -209,20 +213,32 @@ class GitService(ABC):
         self.reponame = conf["repo_name"]
         self.qw_resources = importlib.resources.files(qw.resources)
 
+    @cached_property
+    def full_name(self) -> str:
+        """Get the full name of the repository, as `username/reponame`."""
+        return f"{self.username}/{self.reponame}"
+
     @abstractmethod
-    def get_issue(self, number: int) -> Issue:
-        """Get the numbered issue."""
+    def get_issue(self, number: int) -> Issue | None:
+        """Get the numbered issue, or None if there is no such open issue."""
         ...
 
+    def get_pull_request(self, number: int) -> PullRequest | None:
+        """Get the numbered pull request, or None if there is no such request."""
+        for pr in self.pull_requests:
+            if pr.number == number:
+                return pr
+        return None
+
     @property
     @abstractmethod
     def issues(self) -> list[Issue]:
-        """Get all issues for the repository."""
+        """Get all open issues for the repository."""
         ...
 
     @property
     @abstractmethod
-    def pull_requests(self) -> list[Issue]:
+    def pull_requests(self) -> list[PullRequest]:
         """Get all pull requests for the repository."""
         ...
 
@@ -245,3 +261,15 @@ class GitService(ABC):
     @abstractmethod
     def check(self) -> bool:
         """Check the connection to the service."""
+
+    def get_remote_fingerprint(self) -> str | None:
+        """
+        Get a value that changes whenever the issues or pull requests change.
+
+        It must change when any issue or pull request is added, edited,
+        closed or removed, not just the most recently updated one.
+
+        :return: The current fingerprint, or None if the service cannot
+        provide one (so the remote stages should not be cached).
+        """
+        return None
@@ -39,6 +39,11 @@ class FileSystemIssue(Issue):
         r"""Get the body of the first comment."""
         return self.markdown_data.content
 
+    @property
+    def is_open(self) -> bool:
+        """Get whether the issue is open, which it is unless its state is closed."""
+        return self.markdown_data.get("state", "open") == "open"
+
     @property
     def item_type(self) -> RemoteItemType:
         """Get the type of the issue, as we may handle a pull request differently to an issue."""
@@ -94,12 +99,11 @@ class FileSystemService(GitService):
         self.issue_objects = [build_file_system_issue(file) for file in mdx_files]
 
     def get_issue(self, number: int):
-        """Get the issue with the specified number."""
+        """Get the open issue with the specified number."""
         matching_issues = [i for i in self.issues if i.number == number]
 
         if len(matching_issues) == 0:
-            msg = "No issues found with number {number}"
-            raise QwError(msg)
+            return None
         if len(matching_issues) != 1:
             msg = "No multiple issues found with {number}"
             raise QwError(msg)
@@ -108,9 +112,9 @@ class FileSystemService(GitService):
 
     @property
     def issues(self):
-        """Get all issues in the root path."""
+        """Get all open issues in the root path."""
         return filter(
-            lambda x: not isinstance(x, FileSystemPullRequest),
+            lambda x: not isinstance(x, FileSystemPullRequest) and x.is_open,
             self.issue_objects,
         )
 
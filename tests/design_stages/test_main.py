@@ -42,3 +42,51 @@ def test_filesystem_service_builds_requirement():
     )
     stages = get_remote_stages(service)
     assert len(stages) == 1
+
+
+@pytest.mark.parametrize(
+    ("issues", "prs", "expected_ids"),
+    [
+        ({3}, None, [2, 3]),
+        (None, {5}, [1, 5]),
+        ({6}, None, [6]),
+        ({99}, None, []),
+    ],
+)
+def test_remote_stages_for_check_include_links(issues, prs, expected_ids):
+    """
+    Given a filesystem service with linked issues and pull requests.
+
+    When remote stages are fetched for a single issue or pull request
+    Then only that stage and the issues it links to should be built
+    """
+    service = FileSystemService(
+        Path(__file__).parents[1] / "resources" / "design_stages",
+        "incorrect_links",
+    )
+    stages = get_remote_stages(service, issues=issues, prs=prs)
+    assert [stage.internal_id for stage in stages] == expected_ids
+
+
+class FailingIssueService(FileSystemService):
+    """FileSystemService that cannot fetch single issues."""
+
+    def get_issue(self, number: int):
+        """Fail as the remote service would."""
+        msg = f"Failed (502) to get issue #{number}"
+        raise QwError(msg)
+
+
+def test_remote_stages_for_check_raise_on_failure():
+    """
+    Given a filesystem service that fails to fetch issues.
+
+    When remote stages are fetched for a single issue
+    Then the failure should be raised rather than the issue being skipped
+    """
+    service = FailingIssueService(
+        Path(__file__).parents[1] / "resources" / "design_stages",
+        "incorrect_links",
+    )
+    with pytest.raises(QwError):
+        get_remote_stages(service, issues={3})
@@ -42,3 +42,13 @@ def test_differences(minimal_requirement) -> None:
     assert diff == {
         "description": {"self": changed.description, "other": original.description},
     }
+
+
+def test_no_differences(minimal_requirement) -> None:
+    """Test that identical and version-only changes give no differences."""
+    original = copy.copy(minimal_requirement)
+    changed = copy.copy(minimal_requirement)
+    assert changed.diff(original) == {}
+
+    changed.version = 2
+    assert changed.diff(original) == {}
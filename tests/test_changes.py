@@ -3,7 +3,13 @@ from pathlib import Path
 
 import pytest
 
-from qw.changes import ChangeHandler
+from qw.base import QwError
+from qw.changes import (
+    ChangeHandler,
+    DiffElement,
+    LocalChangeBulk,
+    LocalChangeInteractive,
+)
 from qw.remote_repo.test_service import FileSystemService
 
 
@@ -122,3 +128,315 @@ def test_same_items_with_changes(  # noqa: PLR0913 ignore too many functions to
     assert items
     assert items[0].title == expected_title
     assert items[0].version == expected_version
+
+
+@pytest.mark.parametrize("test_design_stages", ["incorrect_links"], indirect=True)
+@pytest.mark.parametrize(
+    ("response", "expected_title", "expected_version"),
+    [
+        ("n", "Old title", 1),
+        ("u", "Calculate warfarin", 1),
+        ("i", "Calculate warfarin", 2),
+    ],
+)
+def test_many_items_with_changes(  # noqa: PLR0913 ignore too many functions to call
+    mock_user_input,
+    qw_store_builder,
+    test_design_stages,
+    response,
+    expected_title,
+    expected_version,
+):
+    """
+    Given several Requirements in the local and remote storage, but the local storage has different titles.
+
+    When local and remote items are combined, and the user responds once with a decision for all of them
+    Then every changed stage should have the old title or new title, and increment the version as appropriate
+    """
+    # Arrange
+    input_data = test_design_stages
+    changed_ids = {4, 2}
+    for item in input_data:
+        if item["internal_id"] in changed_ids:
+            item["title"] = "Old title"
+    store = qw_store_builder(input_data)
+    service = FileSystemService(
+        Path(__file__).parent / "resources" / "design_stages",
+        "incorrect_links",
+    )
+    handler = ChangeHandler(service, store)
+    # Act
+    mock_user_input([response])
+    items = handler.combine_local_and_remote_items()
+
+    changed = [item for item in items if item.internal_id in changed_ids]
+    assert len(changed) == len(changed_ids)
+    for item in changed:
+        assert item.title == expected_title
+        assert item.version == expected_version
+
+
+class CachingFileSystemService(FileSystemService):
+    """FileSystemService with a fingerprint, counting how often its issues are listed."""
+
+    def __init__(self, target_dir: str):
+        """Set up the service with the test design stages in target_dir."""
+        super().__init__(
+            Path(__file__).parent / "resources" / "design_stages",
+            target_dir,
+        )
+        self.updated = "update-1"
+        self.fetch_count = 0
+
+    def get_remote_fingerprint(self) -> str | None:
+        """Get the number of items, and the latest update set by the test."""
+        return f"{len(self.issue_objects)} items, {self.updated}"
+
+    @property
+    def issues(self):
+        """Count the fetch, then get all issues in the root path."""
+        self.fetch_count += 1
+        return super().issues
+
+
+def test_remote_stages_cached_until_remote_changes(empty_local_store):
+    """
+    Given A service with a fingerprint and an empty local store.
+
+    When local and remote items are combined several times, an item being updated before the last time
+    Then the remote stages should only be fetched the first time and after the update
+    """
+    service = CachingFileSystemService("incorrect_links")
+    handler = ChangeHandler(service, empty_local_store)
+
+    first = handler.combine_local_and_remote_items()
+    assert service.fetch_count == 1
+
+    cached = handler.combine_local_and_remote_items()
+    assert service.fetch_count == 1
+    assert [item.to_dict() for item in cached] == [item.to_dict() for item in first]
+
+    service.updated = "update-2"
+    handler.combine_local_and_remote_items()
+    assert service.fetch_count == 2  # noqa: PLR2004 second fetch
+    assert empty_local_store.read_remote_cache()["fingerprint"].endswith("update-2")
+
+
+def test_remote_stages_fetched_again_when_issue_removed(empty_local_store):
+    """
+    Given A service with a fingerprint and an empty local store.
+
+    When local and remote items are combined, then again after an issue is removed from the remote
+    Then the remote stages should be fetched again, without the removed issue
+    """
+    removed_id = 2
+    service = CachingFileSystemService("incorrect_links")
+    handler = ChangeHandler(service, empty_local_store)
+    handler.combine_local_and_remote_items()
+
+    service.issue_objects = [
+        issue for issue in service.issue_objects if issue.number != removed_id
+    ]
+    items = handler.combine_local_and_remote_items()
+
+    assert service.fetch_count == 2  # noqa: PLR2004 second fetch
+    assert removed_id not in {item.internal_id for item in items}
+
+
+def test_remote_stages_not_read_from_cache_when_not_wanted(empty_local_store):
+    """
+    Given A service with a fingerprint and an empty local store.
+
+    When local and remote items are combined twice, without using the cache
+    Then the remote stages should be fetched both times
+    """
+    service = CachingFileSystemService("incorrect_links")
+    handler = ChangeHandler(service, empty_local_store, use_cache=False)
+
+    handler.combine_local_and_remote_items()
+    handler.combine_local_and_remote_items()
+
+    assert service.fetch_count == 2  # noqa: PLR2004 second fetch
+
+
+@pytest.mark.parametrize(
+    "cache_text",
+    [
+        "{not json",
+        '{"fingerprint": "6 items, update-1"}',
+        '{"fingerprint": "6 items, update-1", "head": null, "stages": [{"stage": "unknown"}]}',
+    ],
+)
+def test_invalid_remote_cache_is_fetched_again(empty_local_store, cache_text):
+    """
+    Given A service with a fingerprint and a remote stage cache that cannot be used.
+
+    When local and remote items are combined
+    Then the remote stages should be fetched again and the cache replaced
+    """
+    service = CachingFileSystemService("incorrect_links")
+    handler = ChangeHandler(service, empty_local_store)
+    handler.combine_local_and_remote_items()
+    empty_local_store._remote_cache_path.write_text(cache_text)
+
+    items = handler.combine_local_and_remote_items()
+
+    assert items
+    assert service.fetch_count == 2  # noqa: PLR2004 second fetch
+    assert empty_local_store.read_remote_cache()["fingerprint"].endswith("update-1")
+
+
+class FailingPullRequestService(CachingFileSystemService):
+    """CachingFileSystemService that cannot list its pull requests."""
+
+    @property
+    def pull_requests(self):
+        """Fail as the remote service would."""
+        msg = "Failed (502) to get the pull requests"
+        raise QwError(msg)
+
+
+def test_failed_fetch_is_not_cached(empty_local_store):
+    """
+    Given A service with a fingerprint that fails to list its pull requests.
+
+    When local and remote items are combined
+    Then the error should be raised and no remote stage cache written
+    """
+    handler = ChangeHandler(
+        FailingPullRequestService("incorrect_links"),
+        empty_local_store,
+    )
+
+    with pytest.raises(QwError):
+        handler.combine_local_and_remote_items()
+
+    assert empty_local_store.read_remote_cache() is None
+
+
+def handler_with_changed_titles(
+    qw_store_builder,
+    test_design_stages,
+    changed_ids,
+) -> ChangeHandler:
+    """Build ChangeHandler where the local items with changed_ids have old titles."""
+    for item in test_design_stages:
+        if item["internal_id"] in changed_ids:
+            item["title"] = "Old title"
+    store = qw_store_builder(test_design_stages)
+    service = FileSystemService(
+        Path(__file__).parent / "resources" / "design_stages",
+        "incorrect_links",
+    )
+    return ChangeHandler(service, store)
+
+
+def record_shown(monkeypatch, events):
+    """Record each DiffElement shown, and whether it had changed, in events."""
+    monkeypatch.setattr(
+        DiffElement,
+        "show",
+        lambda element: events.append(("show", element.is_changed())),
+    )
+
+
+@pytest.mark.parametrize("test_design_stages", ["incorrect_links"], indirect=True)
+def test_many_changes_shown_before_asking(
+    monkeypatch,
+    qw_store_builder,
+    test_design_stages,
+):
+    """
+    Given several Requirements in the local and remote storage, but the local storage has different titles.
+
+    When local and remote items are combined, and the user responds once with a decision for all of them
+    Then every change should be shown once, before the user is asked
+    """
+    # Arrange
+    changed_ids = {4, 2}
+    handler = handler_with_changed_titles(
+        qw_store_builder,
+        test_design_stages,
+        changed_ids,
+    )
+    events = []
+    record_shown(monkeypatch, events)
+    monkeypatch.setattr(
+        LocalChangeBulk,
+        "ask_policy",
+        classmethod(lambda cls, count: events.append(("ask", count)) or cls(0)),
+    )
+    # Act
+    handler.combine_local_and_remote_items()
+
+    assert events == [("show", True), ("show", True), ("ask", len(changed_ids))]
+
+
+@pytest.mark.parametrize("test_design_stages", ["incorrect_links"], indirect=True)
+def test_many_changes_asked_about_each_shown_once(
+    monkeypatch,
+    qw_store_builder,
+    test_design_stages,
+):
+    """
+    Given several Requirements in the local and remote storage, but the local storage has different titles.
+
+    When local and remote items are combined, and the user chooses to be asked about each of them
+    Then every change should be shown only once, before the user is asked about each
+    """
+    # Arrange
+    changed_ids = {4, 2}
+    handler = handler_with_changed_titles(
+        qw_store_builder,
+        test_design_stages,
+        changed_ids,
+    )
+    events = []
+    record_shown(monkeypatch, events)
+    monkeypatch.setattr(
+        LocalChangeBulk,
+        "ask_policy",
+        classmethod(lambda cls, count: LocalChangeInteractive()),
+    )
+    monkeypatch.setattr(
+        LocalChangeInteractive,
+        "version_increment",
+        lambda determiner: events.append(("ask", None)) or 0,
+    )
+    # Act
+    handler.combine_local_and_remote_items()
+
+    assert events == [("show", True), ("show", True), ("ask", None), ("ask", None)]
+
+
+@pytest.mark.parametrize("test_design_stages", ["incorrect_links"], indirect=True)
+def test_changes_shown_for_given_bulk_answer(
+    monkeypatch,
+    qw_store_builder,
+    test_design_stages,
+):
+    """
+    Given several Requirements in the local and remote storage, but the local storage has different titles.
+
+    When the local items are found with an answer for all changes decided without showing them
+    Then every change should still be shown
+    """
+    # Arrange
+    changed_ids = {4, 2}
+    handler = handler_with_changed_titles(
+        qw_store_builder,
+        test_design_stages,
+        changed_ids,
+    )
+    events = []
+    record_shown(monkeypatch, events)
+    # Act
+    items = list(
+        handler.get_local_items_from_diffs(
+            handler.diff_remote_and_local_items(),
+            LocalChangeBulk(0),
+        ),
+    )
+
+    assert events == [("show", True), ("show", True)]
+    assert all(item.title != "Old title" for item in items)
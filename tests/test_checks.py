@@ -1,8 +1,11 @@
 """Test check behaviour."""
+from pathlib import Path
+
 import pytest
 
 from qw.cli import run_checks_with_impacts
-from qw.design_stages.main import get_local_stages
+from qw.design_stages.main import get_local_stages, get_remote_stages
+from qw.remote_repo.test_service import FileSystemService
 
 
 @pytest.mark.parametrize(
@@ -57,3 +60,36 @@ def test_check_severity(
     assert results.object_count == len(store.read_local_data())
     assert len(results.errors) == expected_error_count
     assert len(results.warnings) == expected_warning_count
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"issues": {2}}, {"issues": {3}}, {"prs": {4}}],
+)
+def test_check_of_one_item_matches_full_check_with_closed_links(
+    empty_local_store,
+    kwargs,
+):
+    """
+    Given a remote service with issues and pull requests that link to closed issues.
+
+    When a single issue or pull request is checked with only it and its links fetched
+    Then the results should be the same as when every remote stage is fetched
+    """
+    service = FileSystemService(
+        Path(__file__).parent / "resources" / "design_stages",
+        "closed_links",
+    )
+    full = run_checks_with_impacts(
+        empty_local_store,
+        get_remote_stages(service),
+        **kwargs,
+    )
+    linked = run_checks_with_impacts(
+        empty_local_store,
+        get_remote_stages(service, **kwargs),
+        **kwargs,
+    )
+    assert linked.errors == full.errors
+    assert linked.warnings == full.warnings
+    assert linked.object_count == full.object_count
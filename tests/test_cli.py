@@ -2,7 +2,8 @@
 import pytest
 from typer.testing import CliRunner
 
-from qw.cli import app
+from qw.base import QwError
+from qw.cli import _sniff_subcommand, app
 from qw.local_store._repository import QwDirRequirementComponents
 
 runner = CliRunner()
@@ -29,11 +30,11 @@ def mock_keyvault_with_value(monkeypatch):
 @pytest.fixture(autouse=True)
 def mocked_store(monkeypatch, empty_local_store):
     """Set the qw local store to be the empty local store."""
-    monkeypatch.setattr("qw.cli.store", empty_local_store)
+    monkeypatch.setattr("qw.cli._store", lambda: empty_local_store)
     return empty_local_store
 
 
-def test_login_success(mock_user_input, mock_keyvault_with_value):
+def test_login_success(mock_keyvault_with_value):
     """
     Given no password exists in the mocked store.
 
@@ -42,15 +43,14 @@ def test_login_success(mock_user_input, mock_keyvault_with_value):
     """
     pw = "I'm a test password"
     mock_keyvault_with_value([None, pw])
-    mock_user_input([pw])
 
-    result = runner.invoke(app, ["login"])
+    result = runner.invoke(app, ["login"], input=f"{pw}\n")
 
     assert "Can connect" in result.stdout
     assert result.exit_code == 0
 
 
-def test_login_pat_exists(mock_user_input, mock_keyvault_with_value):
+def test_login_pat_exists(mock_keyvault_with_value):
     """
     Given password already exists in the mocked store.
 
@@ -59,15 +59,14 @@ def test_login_pat_exists(mock_user_input, mock_keyvault_with_value):
     """
     pw = "I'm a test password"
     mock_keyvault_with_value([pw])
-    mock_user_input([pw])
 
-    result = runner.invoke(app, ["login"])
+    result = runner.invoke(app, ["login"], input=f"{pw}\n")
 
     assert "Access token already exists" in result.stdout
     assert result.exit_code == 0
 
 
-def test_login_force(mock_user_input, mock_keyvault_with_value):
+def test_login_force(mock_keyvault_with_value):
     """
     Given password already exists in the mocked store.
 
@@ -76,15 +75,14 @@ def test_login_force(mock_user_input, mock_keyvault_with_value):
     """
     pw = "I'm a test password"
     mock_keyvault_with_value([pw, pw])
-    mock_user_input([pw])
 
-    result = runner.invoke(app, ["login", "--force"])
+    result = runner.invoke(app, ["login", "--force"], input=f"{pw}\n")
 
     assert "Can connect" in result.stdout
     assert result.exit_code == 0
 
 
-def test_login_whitespace_password(mock_user_input, mock_keyvault_with_value):
+def test_login_whitespace_password(mock_keyvault_with_value):
     """
     Given no password exists in mocked keychain.
 
@@ -93,9 +91,8 @@ def test_login_whitespace_password(mock_user_input, mock_keyvault_with_value):
     """
     pw_input = "  "
     mock_keyvault_with_value([None])
-    mock_user_input([pw_input])
 
-    result = runner.invoke(app, ["login"])
+    result = runner.invoke(app, ["login"], input=f"{pw_input}\n")
 
     assert "Access token was empty" in " ".join(result.exception.args)
     assert result.exit_code != 0
@@ -186,3 +183,34 @@ def test_configure_force_templates_exist(mocked_store):
 
     assert (mocked_store.base_dir / ".github" / "PULL_REQUEST_TEMPLATE.md").exists()
     assert result.exit_code == 0
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["freeze", "--dry-run"], "freeze"),
+        (["--loglevel", "debug", "--logmodule", "qw.changes", "check"], "check"),
+        (["--help"], None),
+        ([], None),
+    ],
+)
+def test_sniff_subcommand(argv, expected):
+    """
+    Given command line arguments with or without global options.
+
+    When the subcommand is sniffed
+    Then the first argument that is not a global option should be returned
+    """
+    assert _sniff_subcommand(argv) == expected
+
+
+def test_check_rejects_issue_and_review_request():
+    """
+    Given both an issue and a review request.
+
+    When `qw check` is run
+    Then a QwError should be raised before any stages are read
+    """
+    result = runner.invoke(app, ["check", "--issue", "1", "--review-request", "2"])
+
+    assert isinstance(result.exception, QwError)
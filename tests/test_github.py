@@ -0,0 +1,39 @@
+"""Test the GitHub service without connecting to GitHub."""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from qw.remote_repo._github import GitHubService
+
+
+@pytest.mark.parametrize(
+    ("state", "expected_number"),
+    [("OPEN", 7), ("CLOSED", None)],
+)
+def test_get_issue_only_gets_open_issues(monkeypatch, state, expected_number):
+    """
+    Given a GitHub repository with an issue that is open or closed.
+
+    When the issue is fetched by its number
+    Then it should only be found if it is open, as only open issues are listed
+    """
+    issue = {
+        "body": "### Description\n\nAn issue",
+        "labels": {"nodes": [{"name": "qw-requirement"}]},
+        "number": 7,
+        "state": state,
+        "title": "An issue",
+    }
+    response = SimpleNamespace(
+        status_code=200,
+        content=json.dumps({"data": {"repository": {"issue": issue}}}),
+    )
+    monkeypatch.setattr(GitHubService, "_graph_ql", lambda _self, _query: response)
+    service = GitHubService(
+        {"user_name": "organisation", "repo_name": "repo", "token": "token"},
+    )
+
+    found = service.get_issue(7)
+
+    assert (None if found is None else found.number) == expected_number
@@ -0,0 +1,50 @@
+"""Tests for the local store."""
+import json
+
+import pytest
+
+from qw.local_store._json import _dump_json
+
+
+def test_interrupted_write_keeps_local_data(qw_store_builder, test_design_stages):
+    """
+    Given A local store with a Requirement.
+
+    When new data is written, but producing it is interrupted (as by Ctrl-C at a prompt)
+    Then the stored data should be unchanged and no temporary file left behind
+    """
+    store = qw_store_builder(test_design_stages)
+
+    def interrupted_items():
+        yield {"title": "Partly written"}
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        store.write_local_data(interrupted_items())
+
+    assert store.read_local_data() == test_design_stages
+    assert list(store.get_qw_dir().glob("*.tmp")) == []
+
+
+def test_written_json_matches_json_module(qw_store_builder, test_design_stages):
+    """
+    Given A Requirement with non-ASCII characters in its title.
+
+    When it is written to the local store, and the same data as configuration
+    Then both files should be byte-for-byte what the json module writes, with non-ASCII characters escaped
+    """
+    test_design_stages[0]["title"] = "Caf\u00e9 \u2615 \U0001d11e"
+    store = qw_store_builder(test_design_stages)
+    config_path = store.get_qw_dir() / "conf.json"
+    _dump_json({"stages": test_design_stages}, config_path)
+
+    assert store._data_path.read_text(encoding="ascii") == json.dumps(
+        test_design_stages,
+        sort_keys=True,
+        indent=2,
+    )
+    assert config_path.read_text(encoding="ascii") == json.dumps(
+        {"stages": test_design_stages},
+        sort_keys=True,
+        indent=2,
+    )